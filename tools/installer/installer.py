@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import io
 import os
+import stat
+import base64
+import errno
+import bisect
+import sys
 import json
 import shutil
 import zipfile
+import tempfile
+import time
 import threading
 import queue
+import concurrent.futures
+import multiprocessing
+import http.client
+import urllib.parse
 import urllib.request
-import urllib.error
+import ctypes
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 import tkinter as tk
@@ -50,6 +63,18 @@ DEFAULT_STRUCTURE = {
 
 DEFAULT_CUSTOM_STRUCTURE_JSON = json.dumps(DEFAULT_STRUCTURE, indent=2)
 
+# create_dirs of DEFAULT_STRUCTURE, already split into relative Paths
+DEFAULT_CREATE_DIRS = tuple(Path(d) for d in DEFAULT_STRUCTURE["create_dirs"])
+
+
+# Downloads larger than this spill from memory to a temp file while spooling.
+SPOOL_MAX_BYTES = 64 * 1024 * 1024
+
+EXTRACT_WORKERS = 4
+DELETE_WORKERS = 8
+DELETE_POOL_MIN_FILES = 1000  # fewer files: the pool measured no faster than shutil.rmtree
+EXTRACT_CHUNK = 1024 * 1024
+
 
 # ========================= UTIL =========================
 
@@ -61,23 +86,105 @@ def ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except PermissionError:
+        # read-only file (Windows): clear the flag and retry. Never chmod a
+        # link, that would change its target.
+        if os.path.islink(path):
+            return
+        try:
+            os.chmod(path, stat.S_IWRITE)
+            os.remove(path)
+        except OSError:
+            pass
+    except OSError:
+        pass
+
+
+def _rmtree_onexc(func, path: str, exc: BaseException) -> None:
+    """shutil.rmtree onexc: same read-only retry as _remove_file, other errors ignored."""
+    if isinstance(exc, PermissionError) and not os.path.islink(path):
+        try:
+            os.chmod(path, stat.S_IWRITE)
+            func(path)
+        except OSError:
+            pass
+
+
+def _fast_rmtree(path: str) -> None:
+    """
+    Remove a directory tree: one scandir walk collects everything. Trees with
+    at least DELETE_POOL_MIN_FILES files have them removed on a thread pool
+    (unlink/DeleteFile drop the GIL), then the directories children-first;
+    smaller ones go to shutil.rmtree. Like shutil.rmtree, it never descends
+    into symlinks or Windows junctions; those are removed themselves.
+    """
+    dirs: list[str] = []
+    files: list[str] = []
+    stack = [path]
+    while stack:
+        d = stack.pop()
+        dirs.append(d)
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_junction():
+                        dirs.append(entry.path)  # rmdir drops the link, not the target
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except OSError:
+            pass
+
+    if len(files) < DELETE_POOL_MIN_FILES:
+        shutil.rmtree(path, onexc=_rmtree_onexc)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DELETE_WORKERS) as ex:
+        for _ in ex.map(_remove_file, files):
+            pass
+
+    for d in reversed(dirs):
+        try:
+            os.rmdir(d)
+        except OSError:
+            pass
+
+
 def delete_tree(p: Path) -> None:
     if not p.exists():
         return
     if p.is_file() or p.is_symlink():
-        try:
-            p.chmod(0o666)
-        except Exception:
-            pass
-        try:
-            p.unlink()
-        except Exception:
-            try:
-                os.remove(str(p))
-            except Exception:
-                pass
+        _remove_file(str(p))
+        return
+    if p.is_junction():
+        os.rmdir(p)
         return
-    shutil.rmtree(p, ignore_errors=True)
+    _fast_rmtree(str(p))
+
+
+def _fast_copy_then_unlink(src: str, dst: str) -> None:
+    """
+    Cross-filesystem move of one file. shutil.copy2 already copies in kernel
+    space on 3.14+ (CopyFile2, fcopyfile, copy_file_range/sendfile) and keeps
+    symlinks as links here; src is removed only once the copy succeeded.
+    """
+    shutil.copy2(src, dst, follow_symlinks=False)
+    os.unlink(src)
+
+
+def _move_file(src: str, dst: str) -> None:
+    if os.path.lexists(dst):
+        delete_tree(Path(dst))
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _fast_copy_then_unlink(src, dst)
 
 
 def move_tree(src: Path, dst: Path) -> None:
@@ -87,22 +194,88 @@ def move_tree(src: Path, dst: Path) -> None:
 
     if src.is_file():
         ensure_dir(dst.parent)
-        if dst.exists():
-            delete_tree(dst)
-        try:
-            src.replace(dst)
-        except Exception:
-            shutil.copy2(src, dst)
-            delete_tree(src)
+        _move_file(str(src), str(dst))
         return
 
-    ensure_dir(dst)
-    for item in src.iterdir():
-        move_tree(item, dst / item.name)
+    # Nothing to merge with: a single rename moves the whole subtree when
+    # src and dst share a filesystem.
+    if not dst.exists():
+        ensure_dir(dst.parent)
+        try:
+            os.replace(src, dst)
+            return
+        except OSError:
+            pass
+
+    # merge into an existing tree; subdirs missing on the dst side are still
+    # moved with one rename each
+    emptied: list[str] = []
+    stack = [(str(src), str(dst))]
+    while stack:
+        s, d = stack.pop()
+        os.makedirs(d, exist_ok=True)
+        emptied.append(s)
+        with os.scandir(s) as it:
+            entries = list(it)
+        for entry in entries:
+            target = os.path.join(d, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if not os.path.lexists(target):
+                    try:
+                        os.replace(entry.path, target)
+                        continue
+                    except OSError:
+                        pass
+                stack.append((entry.path, target))
+            else:
+                _move_file(entry.path, target)
+    for s in reversed(emptied):
+        try:
+            os.rmdir(s)
+        except OSError:
+            pass
+
+
+# Linux FICLONE ioctl: share the source's data blocks (btrfs, xfs, ...)
+_FICLONE = 0x40049409
+_libsystem = None
+
+
+def _clone_file(src: str, dst: str) -> bool:
+    """
+    Copy-on-write clone src -> dst (reflink / clonefile). Returns False when the
+    platform has no clone call; raises OSError when the filesystem refuses.
+    """
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        return True
+
+    if sys.platform == "darwin":
+        global _libsystem
+        if _libsystem is None:
+            _libsystem = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        if _libsystem.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), src)
+        return True
+
+    return False
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """shutil.copy2, but without copying any data where the filesystem can clone."""
     try:
-        src.rmdir()
-    except Exception:
+        if _clone_file(src, dst):
+            shutil.copystat(src, dst)
+            return
+    except OSError:
         pass
+    shutil.copy2(src, dst)
 
 
 def copy_tree(src: Path, dst: Path) -> None:
@@ -113,25 +286,39 @@ def copy_tree(src: Path, dst: Path) -> None:
         ensure_dir(dst.parent)
         if dst.exists():
             delete_tree(dst)
-        shutil.copy2(src, dst)
+        _fast_copy(str(src), str(dst))
         return
-    ensure_dir(dst)
-    for item in src.iterdir():
-        copy_tree(item, dst / item.name)
+    stack = [(str(src), str(dst))]
+    while stack:
+        s, d = stack.pop()
+        os.makedirs(d, exist_ok=True)
+        with os.scandir(s) as it:
+            for entry in it:
+                target = os.path.join(d, entry.name)
+                # links are followed, like the recursive version did; dangling
+                # ones are skipped
+                if entry.is_dir():
+                    stack.append((entry.path, target))
+                elif entry.is_file():
+                    if os.path.lexists(target):
+                        delete_tree(Path(target))
+                    _fast_copy(entry.path, target)
 
 
 def count_children_one_level(dir_path: Path) -> tuple[int, int, str | None]:
-    if not dir_path.exists() or not dir_path.is_dir():
-        return (0, 0, None)
     d = 0
     f = 0
     only_dir = None
-    for item in dir_path.iterdir():
-        if item.is_dir():
-            d += 1
-            only_dir = item.name
-        else:
-            f += 1
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.is_dir():
+                    d += 1
+                    only_dir = entry.name
+                else:
+                    f += 1
+    except (FileNotFoundError, NotADirectoryError):
+        return (0, 0, None)
     if d == 1 and f == 0:
         return (d, f, only_dir)
     return (d, f, None)
@@ -141,32 +328,64 @@ def flatten_single_dir_wrapper(dir_path: Path) -> bool:
     d, f, only = count_children_one_level(dir_path)
     if not (d == 1 and f == 0 and only):
         return False
-    inner = dir_path / only
-    if not inner.is_dir():
+    inner = os.path.join(dir_path, only)
+    try:
+        with os.scandir(inner) as it:
+            entries = list(it)
+    except NotADirectoryError:
         return False
-    for item in inner.iterdir():
-        move_tree(item, dir_path / item.name)
+    for entry in entries:
+        move_tree(Path(entry.path), dir_path / entry.name)
     try:
-        inner.rmdir()
-    except Exception:
+        os.rmdir(inner)
+    except OSError:
         pass
     return True
 
 
-def looks_like_project_root(dir_path: Path, markers: list[str]) -> bool:
+def _child_dirs(dir_path: str | Path) -> list[str]:
+    """Paths of the subdirectories of dir_path, from a single scandir."""
+    try:
+        with os.scandir(dir_path) as it:
+            return [e.path for e in it if e.is_dir()]
+    except OSError:
+        return []
+
+
+def _dir_names(paths: list[str]) -> frozenset[str]:
+    return frozenset(os.path.normcase(os.path.basename(p)) for p in paths)
+
+
+def _child_dir_names(dir_path: str | Path) -> frozenset[str]:
+    """Names (normcased) of the subdirectories of dir_path, from a single scandir."""
+    return _dir_names(_child_dirs(dir_path))
+
+
+def looks_like_project_root(dir_path: str | Path, markers: list[str]) -> bool:
+    names = _child_dir_names(dir_path)
     hits = 0
     for m in markers:
-        if (dir_path / m).is_dir():
+        m = os.path.normcase(m)
+        if os.path.sep in m:
+            # nested marker, can't be answered from the listing
+            hits += os.path.isdir(os.path.join(dir_path, m))
+        elif m in names:
             hits += 1
     return hits >= 2
 
 
 def find_project_root_near(start_dir: Path, repo_markers: list[str]) -> Path:
+    # Candidates get probed more than once (e.g. the end of the unwrap chain);
+    # the tree isn't modified until the fallback below, so memoize per call.
+    @functools.lru_cache(maxsize=128)
+    def is_root(path: str) -> bool:
+        return looks_like_project_root(path, repo_markers)
+
     cur = start_dir
 
     # unwrap chain
     for _ in range(10):
-        if looks_like_project_root(cur, repo_markers):
+        if is_root(str(cur)):
             return cur
         d, f, only = count_children_one_level(cur)
         if d == 1 and f == 0 and only:
@@ -174,23 +393,25 @@ def find_project_root_near(start_dir: Path, repo_markers: list[str]) -> Path:
             continue
         break
 
-    if looks_like_project_root(cur, repo_markers):
+    if is_root(str(cur)):
         return cur
 
     # one-level
-    candidates: list[Path] = []
-    for item in cur.iterdir():
-        if item.is_dir():
-            if looks_like_project_root(item, repo_markers):
-                return item
-            candidates.append(item)
+    candidates: list[str] = []
+    with os.scandir(cur) as it:
+        for entry in it:
+            if entry.is_dir():
+                if is_root(entry.path):
+                    return Path(entry.path)
+                candidates.append(entry.path)
 
     # two-level
     for c in candidates[:32]:
         try:
-            for item in c.iterdir():
-                if item.is_dir() and looks_like_project_root(item, repo_markers):
-                    return item
+            with os.scandir(c) as it:
+                for entry in it:
+                    if entry.is_dir() and is_root(entry.path):
+                        return Path(entry.path)
         except Exception:
             pass
 
@@ -201,21 +422,167 @@ def find_project_root_near(start_dir: Path, repo_markers: list[str]) -> Path:
     return cur
 
 
-def extract_zip(zip_path: Path, dest_dir: Path) -> None:
+# characters Windows doesn't allow in file names; zipfile maps them to "_"
+_WINDOWS_ILLEGAL_NAME_CHARS = str.maketrans(':<>|"?*', "_" * 7)
+
+
+def _member_target(dest_dir: str, name: str) -> str | None:
+    """Where a ZIP member lands under dest_dir (same sanitizing as extractall)."""
+    arcname = name.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [x for x in arcname.split(os.path.sep) if x not in ("", os.path.curdir, os.path.pardir)]
+    if os.path.sep == "\\":
+        # ZipFile._sanitize_windows_name: illegal characters, trailing dots/spaces
+        parts = [x.translate(_WINDOWS_ILLEGAL_NAME_CHARS).rstrip(" .") for x in parts]
+        parts = [x for x in parts if x]
+    if not parts:
+        return None
+    return os.path.join(dest_dir, *parts)
+
+
+def _plan_members(
+    infos: list[zipfile.ZipInfo], dest_dir: str, select=None, strip: str = ""
+) -> list[tuple[zipfile.ZipInfo, str]]:
+    """
+    Map members (optionally filtered by select(name) -> bool) to their targets
+    and create every directory they need in one pass. Returns the file members.
+    With strip, only members under that name prefix are kept, relative to it.
+    Members mapping to the same target keep the last one, as extractall would
+    end up with, instead of racing each other on the pool.
+    """
+    files: dict[str, tuple[zipfile.ZipInfo, str]] = {}
+    dirs: set[str] = set()
+    for info in infos:
+        if not info.filename.startswith(strip):
+            continue
+        if select is not None and not select(info.filename):
+            continue
+        target = _member_target(dest_dir, info.filename[len(strip):])
+        if target is None:
+            continue
+        if info.is_dir():
+            dirs.add(target)
+        else:
+            dirs.add(os.path.dirname(target))
+            files[os.path.normcase(target)] = (info, target)
+
+    for d in sorted(dirs):
+        os.makedirs(d, exist_ok=True)
+    return list(files.values())
+
+
+def _run_pool(fn, items: list[tuple], workers: int) -> None:
+    """fn(*item) for every item on a thread pool; the first error cancels the rest."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(fn, *item) for item in items]
+        try:
+            for f in concurrent.futures.as_completed(futures):
+                f.result()
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            raise
+
+
+def _bad_zip(zip_src, e: zipfile.BadZipFile) -> InstallError:
+    name = zip_src if isinstance(zip_src, Path) else "downloaded archive"
+    return InstallError(f"Bad ZIP file: {name}\n{e}")
+
+
+def extract_zip_parallel(
+    zip_src, dest_dir: Path, workers: int = EXTRACT_WORKERS, select=None, strip: str = ""
+) -> None:
+    """
+    Extract a ZIP given either its path or an open, seekable binary file object.
+    Members are inflated on a thread pool (zlib drops the GIL while it works);
+    every target directory is created up front in one pass. select/strip are
+    passed on to _plan_members.
+    """
     ensure_dir(dest_dir)
     try:
-        with zipfile.ZipFile(zip_path, "r") as z:
-            z.extractall(dest_dir)
+        with zipfile.ZipFile(zip_src, "r") as z:
+            files = _plan_members(z.infolist(), str(dest_dir), select, strip)
+
+            # ZipFile.open touches shared state; reads after that are locked internally
+            open_lock = threading.Lock()
+
+            def extract_one(info: zipfile.ZipInfo, target: str) -> None:
+                if strip and os.path.lexists(target):
+                    # extracting over an existing install: clear what's there
+                    # first, like move_tree does (read-only files, links, dirs)
+                    if os.path.isdir(target) and not os.path.islink(target):
+                        delete_tree(Path(target))
+                    else:
+                        _remove_file(target)
+                with open_lock:
+                    src = z.open(info, "r")
+                with src, open(target, "wb") as out:
+                    shutil.copyfileobj(src, out, EXTRACT_CHUNK)
+
+            _run_pool(extract_one, files, workers)
     except zipfile.BadZipFile as e:
-        raise InstallError(f"Bad ZIP file: {zip_path}\n{e}") from e
+        raise _bad_zip(zip_src, e) from e
+
+
+def find_zip_project_root(zip_src, repo_markers: list[str]) -> str | None:
+    """
+    Member-name prefix of the project root inside a ZIP ("" or e.g.
+    "SDLite-main/"), decided from the central directory alone: the shallowest
+    folder with at least two of repo_markers as subfolders, as in
+    looks_like_project_root. None when no folder qualifies.
+    """
+    try:
+        with zipfile.ZipFile(zip_src, "r") as z:
+            names = z.namelist()
+    except zipfile.BadZipFile as e:
+        raise _bad_zip(zip_src, e) from e
+
+    # every folder implied by the listing; archives often omit the dir entries
+    dirs = {""}
+    for name in names:
+        parts = name.split("/")[:-1]
+        for i in range(1, len(parts) + 1):
+            dirs.add("/".join(parts[:i]) + "/")
+    normed = {os.path.normcase(d) for d in dirs}
+
+    for prefix in sorted(dirs, key=lambda d: (d.count("/"), d)):
+        hits = sum(os.path.normcase(f"{prefix}{m}/") in normed for m in repo_markers)
+        if hits >= 2:
+            return prefix
+    return None
 
 
 def ensure_structure(install_dir: Path, structure: dict) -> None:
-    for d in structure.get("create_dirs", []):
-        ensure_dir(install_dir / Path(d))
+    if structure is DEFAULT_STRUCTURE:
+        rel_dirs = DEFAULT_CREATE_DIRS
+    else:
+        rel_dirs = tuple(Path(d) for d in structure.get("create_dirs", []))
+
+    # Deepest first: mkdir(parents=True) already creates every ancestor, so
+    # e.g. "bin" needs no syscall of its own once "bin/debug" exists.
+    created: set[Path] = set()
+    for rel in sorted(rel_dirs, key=lambda r: len(r.parts), reverse=True):
+        p = install_dir / rel
+        if p in created:
+            continue
+        ensure_dir(p)
+        created.add(p)
+        created.update(p.parents)
+
+
+# key, required, container type, description (every element/value must be a string)
+STRUCTURE_SCHEMA = (
+    ("create_dirs", True, list, "a list of strings"),
+    ("markers", True, dict, "an object/dict of strings"),
+    ("repo_root_markers", False, list, "a list of strings"),
+)
 
 
+@functools.lru_cache(maxsize=4)
 def parse_structure_json(text: str) -> dict:
+    """Parse and validate custom structure JSON. Cached: don't mutate the result."""
     try:
         obj = json.loads(text)
     except Exception as e:
@@ -223,12 +590,15 @@ def parse_structure_json(text: str) -> dict:
 
     if not isinstance(obj, dict):
         raise InstallError("Custom structure JSON must be an object/dict.")
-    if "create_dirs" not in obj or "markers" not in obj:
-        raise InstallError("Custom structure JSON must include 'create_dirs' and 'markers'.")
-    if not isinstance(obj["create_dirs"], list) or not isinstance(obj["markers"], dict):
-        raise InstallError("'create_dirs' must be a list and 'markers' must be an object/dict.")
-    if "repo_root_markers" in obj and not isinstance(obj["repo_root_markers"], list):
-        raise InstallError("'repo_root_markers' must be a list if present.")
+    for key, required, container, desc in STRUCTURE_SCHEMA:
+        if key not in obj:
+            if required:
+                raise InstallError(f"Custom structure JSON must include '{key}'.")
+            continue
+        value = obj[key]
+        items = value.values() if isinstance(value, dict) else value
+        if not isinstance(value, container) or not all(isinstance(v, str) for v in items):
+            raise InstallError(f"'{key}' must be {desc}" + ("." if required else " if present."))
     return obj
 
 
@@ -236,6 +606,11 @@ def parse_structure_json(text: str) -> dict:
 
 TOOLCHAIN_NAME = "x86_64-w64-mingw32"
 TOOLCHAIN_PAYLOAD_DIRS = ("include", "lib", "bin")
+TOOLCHAIN_PAYLOAD_SET = frozenset(TOOLCHAIN_PAYLOAD_DIRS)
+
+
+def _is_payload_root(child_dir_names: frozenset[str]) -> bool:
+    return TOOLCHAIN_NAME in child_dir_names or TOOLCHAIN_PAYLOAD_SET <= child_dir_names
 
 
 def find_sdl_payload_root(extracted_root: Path, log) -> Path:
@@ -244,37 +619,38 @@ def find_sdl_payload_root(extracted_root: Path, log) -> Path:
       - either TOOLCHAIN_NAME/ (preferred), or
       - include/lib/bin directly
     Returns the directory that contains those.
+    Each directory is listed once; the probes are set lookups on that listing.
     """
-    toolchain = extracted_root / TOOLCHAIN_NAME
-    if toolchain.is_dir():
-        return extracted_root
-
-    if all((extracted_root / d).exists() for d in TOOLCHAIN_PAYLOAD_DIRS):
+    one = _child_dirs(extracted_root)
+    if _is_payload_root(_dir_names(one)):
         return extracted_root
 
     # try a small breadth search: one-level and two-level
-    one = [p for p in extracted_root.iterdir() if p.is_dir()]
+    two_of: dict[str, list[str]] = {}
     for p in one:
-        if (p / TOOLCHAIN_NAME).is_dir():
-            return p
-        if all((p / d).exists() for d in TOOLCHAIN_PAYLOAD_DIRS):
-            return p
+        two_of[p] = _child_dirs(p)
+        if _is_payload_root(_dir_names(two_of[p])):
+            return Path(p)
 
     for p in one[:32]:
-        try:
-            two = [q for q in p.iterdir() if q.is_dir()]
-        except Exception:
-            continue
-        for q in two[:64]:
-            if (q / TOOLCHAIN_NAME).is_dir():
-                return q
-            if all((q / d).exists() for d in TOOLCHAIN_PAYLOAD_DIRS):
-                return q
+        for q in two_of[p][:64]:
+            if _is_payload_root(_child_dir_names(q)):
+                return Path(q)
 
     log("WARNING: Could not confidently detect SDL payload root; using extracted root as fallback.")
     return extracted_root
 
 
+def _is_missing_or_empty_dir(p: Path) -> bool:
+    try:
+        with os.scandir(p) as it:
+            return next(it, None) is None
+    except FileNotFoundError:
+        return True
+    except NotADirectoryError:
+        return False
+
+
 def stage_install_sdl_zip(
     tmp_extract_dir: Path,
     install_dir: Path,
@@ -288,6 +664,8 @@ def stage_install_sdl_zip(
       - Delete external/<name>
       - Rename staging -> external/<name>
     This prevents merging and preserves toolchain folder naming.
+    When external/<name> is missing or empty (first install) and we're moving,
+    there is nothing to replace, so the payload is moved straight into place.
     """
 
     external_dir = install_dir / "external"
@@ -296,16 +674,19 @@ def stage_install_sdl_zip(
     dest_final = external_dir / external_name
     dest_stage = external_dir / f"{external_name}.__staging__"
 
-    # Clean staging if leftover
-    delete_tree(dest_stage)
-    ensure_dir(dest_stage)
+    direct = not prefer_copy and _is_missing_or_empty_dir(dest_final)
+    if direct:
+        dest_root = dest_final
+    else:
+        # Clean staging if leftover
+        dest_root = dest_stage
+        delete_tree(dest_stage)
+        ensure_dir(dest_stage)
 
     # Unwrap wrappers at tmp root to get closer to real payload
     for _ in range(12):
         # If we already see either toolchain folder or include/lib/bin at root, stop unwrapping
-        if (tmp_extract_dir / TOOLCHAIN_NAME).is_dir():
-            break
-        if all((tmp_extract_dir / d).exists() for d in TOOLCHAIN_PAYLOAD_DIRS):
+        if _is_payload_root(_child_dir_names(tmp_extract_dir)):
             break
         if not flatten_single_dir_wrapper(tmp_extract_dir):
             break
@@ -319,8 +700,8 @@ def stage_install_sdl_zip(
     else:
         src_payload = payload_root
 
-    # Create toolchain folder under staging
-    stage_toolchain = dest_stage / TOOLCHAIN_NAME
+    # Create toolchain folder under staging (or the final folder when direct)
+    stage_toolchain = dest_root / TOOLCHAIN_NAME
     ensure_dir(stage_toolchain)
 
     # Copy/move ONLY include/lib/bin into staging toolchain folder
@@ -339,23 +720,26 @@ def stage_install_sdl_zip(
             log(f"WARNING: {external_name} payload missing '{dname}/' at {src_payload}")
 
     if not copied_any:
+        if direct:
+            delete_tree(stage_toolchain)
         raise InstallError(
             f"{external_name} install failed: could not find any of include/lib/bin in extracted ZIP.\n"
             f"Looked in: {src_payload}"
         )
 
-    # Now swap in staging atomically-ish (delete then rename)
-    log(f"Replacing {dest_final} using staging folder...")
-    delete_tree(dest_final)
+    if not direct:
+        # Now swap in staging atomically-ish (delete then rename)
+        log(f"Replacing {dest_final} using staging folder...")
+        delete_tree(dest_final)
 
-    try:
-        dest_stage.replace(dest_final)
-    except Exception:
-        # fallback: move contents then delete staging
-        ensure_dir(dest_final)
-        for item in dest_stage.iterdir():
-            move_tree(item, dest_final / item.name)
-        delete_tree(dest_stage)
+        try:
+            dest_stage.replace(dest_final)
+        except Exception:
+            # fallback: move contents then delete staging
+            ensure_dir(dest_final)
+            for item in dest_stage.iterdir():
+                move_tree(item, dest_final / item.name)
+            delete_tree(dest_stage)
 
     # sanity: ensure toolchain folder exists in final
     if not (dest_final / TOOLCHAIN_NAME).is_dir():
@@ -371,53 +755,834 @@ class DownloadProgress:
     total: int | None
 
 
+DOWNLOAD_CHUNK = 1024 * 1024
+PROGRESS_INTERVAL = 0.25  # seconds between progress callbacks per download
+
+
+class _ProgressReader:
+    """Wraps a response so copyfileobj can drive it while we count bytes."""
+
+    def __init__(self, raw, label: str, total: int | None, progress_cb):
+        self.raw = raw
+        self.label = label
+        self.total = total
+        self.progress_cb = progress_cb
+        self.got = 0
+        self.last = time.monotonic()
+
+    def read(self, n: int = -1) -> bytes:
+        data = self.raw.read(n)
+        self.got += len(data)
+        now = time.monotonic()
+        if data and now - self.last >= PROGRESS_INTERVAL:
+            self.last = now
+            self.report()
+        return data
+
+    def report(self) -> None:
+        self.progress_cb(DownloadProgress(label=self.label, got=self.got, total=self.total))
+
+
+HTTP_TIMEOUT = 30
+MAX_REDIRECTS = 8
+DOWNLOAD_META_NAME = ".meta.json"  # ETag / Last-Modified per URL, next to kept downloads
+
+
+class RangeExpired(InstallError):
+    """A byte range was refused (401/403), e.g. because a signed URL expired."""
+
+
 class Downloader:
+    """
+    HTTP(S) GETs over kept-alive connections, pooled per (scheme, host) so the
+    redirect hops and sibling downloads reuse sockets instead of redoing TLS.
+    Safe to share between threads.
+    """
+
     def __init__(self, user_agent: str = "SDLiteSetup/2.1"):
         self.user_agent = user_agent
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._pool_lock = threading.Lock()
+        self._meta_lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._pool_lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for c in conns:
+            c.close()
 
     def download(self, url: str, dst: Path, label: str, progress_cb) -> None:
+        """
+        Download url to dst. If dst is a previous download of the same url, the
+        request is made conditional and a 304 keeps the existing file.
+        """
         ensure_dir(dst.parent)
+        meta_path = dst.parent / DOWNLOAD_META_NAME
+
+        headers = {}
+        cached = self._read_meta(meta_path).get(url) if dst.is_file() else None
+        if isinstance(cached, dict) and cached.get("path") == str(dst):
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        tmp = dst.with_suffix(dst.suffix + ".part")
+        if tmp.exists():
+            delete_tree(tmp)
+
+        with open(tmp, "wb") as f:
+            validators = self._fetch(url, f, label, progress_cb, headers)
+
+        if validators is None:
+            delete_tree(tmp)
+            size = dst.stat().st_size
+            progress_cb(DownloadProgress(label=label, got=size, total=size))
+            return
 
-        req = urllib.request.Request(
-            url,
-            headers={"User-Agent": self.user_agent, "Accept": "*/*"},
-            method="GET",
-        )
+        if dst.exists():
+            delete_tree(dst)
+        tmp.replace(dst)
+
+        with self._meta_lock:
+            meta = self._read_meta(meta_path)
+            if validators["etag"] or validators["last_modified"]:
+                meta[url] = {**validators, "path": str(dst)}
+            else:
+                meta.pop(url, None)
+            try:
+                meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+            except OSError:
+                pass
+
+    def download_to_fileobj(self, url: str, fileobj, label: str, progress_cb) -> None:
+        """Stream the response body for url into an open binary file object."""
+        self._fetch(url, fileobj, label, progress_cb)
+
+    def probe_ranges(self, url: str) -> tuple[str, int] | None:
+        """
+        Check whether url (after redirects) serves byte ranges. Returns the final
+        URL and the full size, or None if the server ignores Range.
+        """
+        try:
+            final_url, key, conn, resp = self._get(url, {"Range": "bytes=0-0"})
+            content_range = resp.getheader("Content-Range") or ""
+            if resp.status != 206 or "/" not in content_range:
+                conn.close()  # don't drain a full 200 body just to reuse the socket
+                return None
+            resp.read()
+            self._release(key, conn, resp)
+        except (http.client.HTTPException, OSError) as e:
+            raise InstallError(f"Network error while downloading:\n{url}\n{e}") from e
+
+        size = content_range.rsplit("/", 1)[1].strip()
+        return (final_url, int(size)) if size.isdigit() else None
+
+    def fetch_range(self, url: str, start: int, end: int) -> bytes:
+        """Bytes start..end (inclusive) of url."""
+        try:
+            _, key, conn, resp = self._get(url, {"Range": f"bytes={start}-{end}"})
+            try:
+                if resp.status in (401, 403):
+                    raise RangeExpired(f"HTTP {resp.status} {resp.reason} for a byte range of:\n{url}")
+                if resp.status != 206:
+                    raise InstallError(f"HTTP {resp.status} {resp.reason} for a byte range of:\n{url}")
+                data = resp.read()
+            except BaseException:
+                conn.close()
+                raise
+            self._release(key, conn, resp)
+        except (http.client.HTTPException, OSError) as e:
+            raise InstallError(f"Network error while downloading:\n{url}\n{e}") from e
 
+        if len(data) != end - start + 1:
+            raise InstallError(f"Short byte range ({len(data)} bytes) from:\n{url}")
+        return data
+
+    def _fetch(self, url: str, fileobj, label: str, progress_cb, headers: dict | None = None) -> dict | None:
+        """
+        GET url into fileobj. Returns the response's cache validators, or None
+        when the server answered 304 Not Modified (nothing written).
+        """
         try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                status = getattr(resp, "status", None)
-                if status is not None and status != 200:
-                    raise InstallError(f"HTTP {status} while downloading:\n{url}")
-
-                total = resp.headers.get("Content-Length")
-                total_int = int(total) if total and total.isdigit() else None
-
-                tmp = dst.with_suffix(dst.suffix + ".part")
-                if tmp.exists():
-                    delete_tree(tmp)
-
-                got = 0
-                chunk = 64 * 1024
-
-                with open(tmp, "wb") as f:
-                    while True:
-                        data = resp.read(chunk)
-                        if not data:
-                            break
-                        f.write(data)
-                        got += len(data)
-                        progress_cb(DownloadProgress(label=label, got=got, total=total_int))
-
-                if dst.exists():
-                    delete_tree(dst)
-                tmp.replace(dst)
-
-        except urllib.error.HTTPError as e:
-            raise InstallError(f"HTTP error while downloading:\n{url}\n{e}") from e
-        except urllib.error.URLError as e:
+            _, key, conn, resp = self._get(url, headers or {})
+            try:
+                if resp.status == 304:
+                    resp.read()
+                    validators = None
+                else:
+                    if resp.status != 200:
+                        raise InstallError(f"HTTP {resp.status} {resp.reason} while downloading:\n{url}")
+
+                    total = resp.getheader("Content-Length")
+                    total_int = int(total) if total and total.isdigit() else None
+
+                    reader = _ProgressReader(resp, label, total_int, progress_cb)
+                    shutil.copyfileobj(reader, fileobj, DOWNLOAD_CHUNK)
+                    if reader.total is None:
+                        reader.total = reader.got  # finished, so now the size is known
+                    reader.report()
+
+                    validators = {
+                        "etag": resp.getheader("ETag"),
+                        "last_modified": resp.getheader("Last-Modified"),
+                    }
+            except BaseException:
+                conn.close()
+                raise
+            self._release(key, conn, resp)
+            return validators
+
+        except (http.client.HTTPException, OSError) as e:
             raise InstallError(f"Network error while downloading:\n{url}\n{e}") from e
 
+    def _get(self, url: str, headers: dict) -> tuple[str, tuple[str, str], http.client.HTTPConnection, http.client.HTTPResponse]:
+        """
+        Issue a GET, following redirects. Returns the final URL, its pool key,
+        the connection and the response (body unread).
+        """
+        headers = {"User-Agent": self.user_agent, "Accept": "*/*", **headers}
+
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.netloc:
+                raise InstallError(f"Unsupported download URL:\n{url}")
+            key = (parts.scheme, parts.netloc)
+
+            proxy = self._proxy_for(key) if parts.scheme == "http" else None
+            if proxy:
+                # plain-HTTP proxies want the absolute URI, and their credentials on every request
+                target = url
+                hop_headers = {**headers, **self._proxy_address(proxy)[1]}
+            else:
+                target = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+                hop_headers = headers
+
+            conn, resp = self._send(key, target, hop_headers)
+
+            if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+                location = resp.getheader("Location")
+                resp.read()
+                self._release(key, conn, resp)
+                url = urllib.parse.urljoin(url, location)
+                continue
+
+            return url, key, conn, resp
+
+        raise InstallError(f"Too many redirects while downloading:\n{url}")
+
+    def _send(self, key: tuple[str, str], target: str, headers: dict):
+        conn, reused = self._acquire(key)
+        try:
+            conn.request("GET", target, headers=headers)
+            return conn, conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+        # an idle keep-alive connection was dropped by the server; retry on a fresh one
+        conn = self._new_connection(key)
+        try:
+            conn.request("GET", target, headers=headers)
+            return conn, conn.getresponse()
+        except BaseException:
+            conn.close()
+            raise
+
+    def _acquire(self, key: tuple[str, str]) -> tuple[http.client.HTTPConnection, bool]:
+        with self._pool_lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(key), False
+
+    def _release(self, key: tuple[str, str], conn: http.client.HTTPConnection, resp) -> None:
+        if resp.will_close:
+            conn.close()
+            return
+        with self._pool_lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def _proxy_for(self, key: tuple[str, str]) -> str | None:
+        scheme, netloc = key
+        proxy = urllib.request.getproxies().get(scheme)
+        if not proxy or urllib.request.proxy_bypass(netloc.rsplit(":", 1)[0]):
+            return None
+        return proxy
+
+    @staticmethod
+    def _proxy_address(proxy: str) -> tuple[str, dict]:
+        """host[:port] to connect to for a proxy URL, and its Proxy-Authorization header if it has credentials."""
+        parts = urllib.parse.urlsplit(proxy if "://" in proxy else "http://" + proxy)
+        host = parts.hostname or ""
+        if ":" in host:
+            host = f"[{host}]"
+        address = f"{host}:{parts.port}" if parts.port else host
+
+        headers = {}
+        if parts.username is not None:
+            user = urllib.parse.unquote(parts.username)
+            password = urllib.parse.unquote(parts.password or "")
+            token = base64.b64encode(f"{user}:{password}".encode()).decode("ascii")
+            headers["Proxy-Authorization"] = f"Basic {token}"
+        return address, headers
+
+    def _new_connection(self, key: tuple[str, str]) -> http.client.HTTPConnection:
+        scheme, netloc = key
+        proxy = self._proxy_for(key)
+        if proxy:
+            address, proxy_headers = self._proxy_address(proxy)
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(address, timeout=HTTP_TIMEOUT)
+                conn.set_tunnel(netloc, headers=proxy_headers)
+                return conn
+            return http.client.HTTPConnection(address, timeout=HTTP_TIMEOUT)
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=HTTP_TIMEOUT)
+        return http.client.HTTPConnection(netloc, timeout=HTTP_TIMEOUT)
+
+    @staticmethod
+    def _read_meta(meta_path: Path) -> dict:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                obj = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return obj if isinstance(obj, dict) else {}
+
+
+RANGE_READAHEAD = 256 * 1024
+ZIP_TAIL_PREFETCH = 256 * 1024  # usually covers the whole central directory
+
+
+class HttpRangeFile(io.RawIOBase):
+    """
+    Read-only, seekable view of a remote file that fetches what is read via
+    Range requests, which is all zipfile needs to list and open members.
+    `tail` is (offset, bytes) already fetched from the end of the file, so the
+    central directory can be parsed repeatedly without going back to the server.
+    Read-ahead never goes past `limit` (when set) unless the read itself does.
+    If the (signed, short-lived) URL starts answering 401/403, it is refreshed
+    by probing `origin` again.
+    Not thread-safe; use one per thread.
+    """
+
+    def __init__(
+        self,
+        dl: Downloader,
+        url: str,
+        size: int,
+        tail: tuple[int, bytes] = (0, b""),
+        on_fetch=None,
+        origin: str | None = None,
+    ):
+        super().__init__()
+        self.dl = dl
+        self.url = url
+        self.size = size
+        self.pos = 0
+        self.tail = tail
+        self.on_fetch = on_fetch
+        self.origin = origin
+        self.limit: int | None = None
+        self._buf_start = 0
+        self._buf = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self.pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if pos < 0:
+            raise OSError(f"negative seek position {pos}")
+        self.pos = pos
+        return pos
+
+    def readinto(self, b) -> int:
+        want = min(len(b), max(0, self.size - self.pos))
+        done = 0
+        while done < want:
+            pos = self.pos + done
+            for start, data in (self.tail, (self._buf_start, self._buf)):
+                if start <= pos < start + len(data):
+                    break
+            else:
+                end = min(self.size, pos + max(want - done, RANGE_READAHEAD))
+                if self.limit is not None:
+                    end = min(end, max(self.limit, pos + want - done))
+                data = self._fetch(pos, end - 1)
+                start = pos
+                self._buf_start, self._buf = start, data
+                if self.on_fetch is not None:
+                    self.on_fetch(len(data))
+            n = min(want - done, start + len(data) - pos)
+            b[done:done + n] = data[pos - start:pos - start + n]
+            done += n
+        self.pos += done
+        return done
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        try:
+            return self.dl.fetch_range(self.url, start, end)
+        except RangeExpired:
+            if self.origin is None:
+                raise
+        probed = self.dl.probe_ranges(self.origin)
+        if probed is None or probed[1] != self.size:
+            raise InstallError(f"Download changed while extracting:\n{self.origin}")
+        self.url = probed[0]
+        return self.dl.fetch_range(self.url, start, end)
+
+
+def extract_remote_zip(
+    dl: Downloader,
+    url: str,
+    dest_dir: Path,
+    label: str,
+    progress_cb,
+    make_select=None,
+    workers: int = EXTRACT_WORKERS,
+) -> bool:
+    """
+    Extract a ZIP straight from its URL without downloading the whole archive:
+    the central directory comes from one request at the end of the file, then
+    only the members kept by make_select(names) -> select(name) | None are
+    fetched, by range, in parallel.
+    Returns False (having extracted nothing) when the server doesn't do ranges.
+    """
+    origin = url
+    probed = dl.probe_ranges(origin)
+    if probed is None:
+        return False
+    url, size = probed
+
+    tail_start = max(0, size - ZIP_TAIL_PREFETCH)
+    tail = (tail_start, dl.fetch_range(url, tail_start, size - 1))
+
+    ensure_dir(dest_dir)
+    try:
+        listing = HttpRangeFile(dl, url, size, tail)
+        with zipfile.ZipFile(listing, "r") as z:
+            infos = z.infolist()
+            cd_start = z.start_dir
+    except zipfile.BadZipFile as e:
+        raise InstallError(f"Bad ZIP file: {url}\n{e}") from e
+
+    if cd_start < tail_start:
+        # central directory bigger than the prefetch: widen the shared tail so
+        # the workers don't each fetch the rest again (served from the
+        # listing's buffer, which holds what zipfile just read)
+        listing.seek(cd_start)
+        tail = (cd_start, listing.read(tail_start - cd_start) + tail[1])
+
+    # where each member's data ends at the latest: the next local header
+    # (selected or not) or the central directory
+    offsets = sorted({info.header_offset for info in infos} | {cd_start})
+
+    select = make_select([info.filename for info in infos]) if make_select is not None else None
+    files = _plan_members(infos, str(dest_dir), select)
+    total = sum(info.compress_size for info, _ in files)
+
+    lock = threading.Lock()
+    got = 0
+    last = time.monotonic()
+
+    def fetched(n: int) -> None:
+        # same rate limit as _ProgressReader; the final report is made below
+        nonlocal got, last
+        with lock:
+            got += n
+            now = time.monotonic()
+            if now - last < PROGRESS_INTERVAL:
+                return
+            last = now
+            progress = DownloadProgress(label=label, got=min(got, total), total=total)
+        progress_cb(progress)
+
+    # Give each worker a contiguous run of the archive so its read-ahead
+    # covers its own next members rather than another worker's.
+    files.sort(key=lambda ft: ft[0].header_offset)
+    batches: list[tuple[list[tuple[zipfile.ZipInfo, str]]]] = []
+    share = total / max(1, workers)
+    acc = 0
+    for info, target in files:
+        if not batches or acc >= share:
+            batches.append(([],))
+            acc = 0
+        batches[-1][0].append((info, target))
+        acc += info.compress_size
+
+    def extract_batch(batch: list[tuple[zipfile.ZipInfo, str]]) -> None:
+        # read-ahead may run on through members that follow each other in the
+        # archive, but stops where the next member is one we skip
+        limits = [0] * len(batch)
+        run_end = cd_start
+        for i in range(len(batch) - 1, -1, -1):
+            end = offsets[bisect.bisect_right(offsets, batch[i][0].header_offset)]
+            if i + 1 < len(batch) and batch[i + 1][0].header_offset == end:
+                end = run_end
+            limits[i] = run_end = end
+
+        # own ZipFile per worker; its central directory is parsed from the shared tail
+        raw = HttpRangeFile(dl, url, size, tail, on_fetch=fetched, origin=origin)
+        with zipfile.ZipFile(raw, "r") as z_local:
+            for (info, target), limit in zip(batch, limits):
+                raw.limit = limit
+                with z_local.open(info, "r") as src, open(target, "wb") as out:
+                    shutil.copyfileobj(src, out, EXTRACT_CHUNK)
+
+    try:
+        _run_pool(extract_batch, batches, workers)
+    except zipfile.BadZipFile as e:
+        raise InstallError(f"Bad ZIP file: {url}\n{e}") from e
+
+    progress_cb(DownloadProgress(label=label, got=total, total=total))
+    return True
+
+
+def toolchain_member_filter(names: list[str]):
+    """
+    select() for SDL release ZIPs: if the archive has a TOOLCHAIN_NAME folder,
+    keep only what is under it (skips i686, cmake, docs, ...); else keep all.
+    """
+    if not any(TOOLCHAIN_NAME in n.split("/")[:-1] for n in names):
+        return None
+    return lambda name: TOOLCHAIN_NAME in name.split("/")[:-1]
+
+
+# ========================= INSTALL =========================
+
+# share of the progress bar per install phase; sums to 1
+PHASE_WEIGHTS = {"repo_dl": 0.25, "sdl_dl": 0.25, "img_dl": 0.20, "extract": 0.20, "layout": 0.10}
+
+
+class Phase:
+    """One weighted slice of the progress bar; update() takes its own 0..1 fraction."""
+
+    def __init__(self, name: str, weight: float, table: "PhaseTable"):
+        self.name = name
+        self.weight = weight
+        self.frac = 0.0
+        self.table = table
+
+    def update(self, frac: float) -> None:
+        self.table.advance(self, frac)
+
+
+class PhaseTable:
+    """
+    The install phases, indexed by name. Whenever a phase moves, the overall
+    percentage is the weighted sum of all fractions; post(pct) is called only
+    when that integer changes. Fractions never go backwards, so neither does
+    the bar. Safe to update from the download threads.
+    """
+
+    def __init__(self, post, weights: dict[str, float] = PHASE_WEIGHTS):
+        self.post = post
+        self.lock = threading.Lock()
+        self.last = -1
+        self.phases = {name: Phase(name, w, self) for name, w in weights.items()}
+
+    def __getitem__(self, name: str) -> Phase:
+        return self.phases[name]
+
+    def advance(self, phase: Phase, frac: float) -> None:
+        with self.lock:
+            phase.frac = min(1.0, max(phase.frac, frac))
+            n = round(100 * sum(p.weight * p.frac for p in self.phases.values()))
+            if n != self.last:
+                self.last = n
+                self.post(n)
+
+
+def _install_worker(cfg: dict, q) -> None:
+    """
+    The whole install. Runs in a child process (see App.on_install) so the
+    downloads, inflating and tree shuffling get their own GIL and can't stall
+    the Tk loop. cfg holds the option values read on the UI side; everything
+    goes back over q as ("log", str), ("progress", dict) or ("done"/"fail", str).
+    """
+    def log(s: str): q.put(("log", s))
+    def status(s: str): q.put(("progress", {"status": s}))
+    def marquee(on: bool): q.put(("progress", {"marquee": on}))
+
+    install_dir = Path(cfg["install_dir"])
+    phases = PhaseTable(lambda n: q.put(("progress", {"pct": n})))
+
+    spools: list[tempfile.SpooledTemporaryFile] = []
+    dl = Downloader()
+
+    try:
+        # structure selection
+        if cfg["structure_mode"] == "custom":
+            structure = parse_structure_json(cfg["custom_structure"])
+        else:
+            structure = DEFAULT_STRUCTURE
+
+        repo_markers = structure.get("repo_root_markers", DEFAULT_ROOT_MARKERS)
+
+        repo_url = cfg["repo_url"].strip()
+        sdl2_url = cfg["sdl2_url"].strip()
+        img_url = cfg["img_url"].strip()
+
+        if not repo_url or not sdl2_url or not img_url:
+            raise InstallError("Missing one or more download URLs (check Options...).")
+
+        status("Preparing...")
+        log(f"Install directory: {install_dir}")
+        ensure_dir(install_dir)
+
+        # temp dirs
+        dl_dir = install_dir / ".downloads"
+        tmp_repo = install_dir / ".tmp_repo"
+        tmp_sdl = install_dir / ".tmp_sdl2"
+        tmp_img = install_dir / ".tmp_sdl2_image"
+
+        delete_tree(tmp_repo)
+        for d in (tmp_sdl, tmp_img):
+            delete_tree(d)
+            ensure_dir(d)
+
+        # Without "keep downloads" the ZIPs never need to hit the install dir:
+        # they are spooled in memory (overflowing to a temp file past 64 MiB)
+        # and handed straight to zipfile. Kept downloads survive between runs
+        # so unchanged ones can be revalidated instead of fetched again.
+        keep_downloads = cfg["keep_downloads"]
+        if keep_downloads:
+            ensure_dir(dl_dir)
+            repo_zip = dl_dir / "repo.zip"
+            sdl_zip = dl_dir / "sdl2.zip"
+            img_zip = dl_dir / "sdl2_image.zip"
+        else:
+            repo_zip = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+            sdl_zip = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+            img_zip = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+            spools.extend((repo_zip, sdl_zip, img_zip))
+
+        status("Downloading files...")
+
+        fetch = dl.download if keep_downloads else dl.download_to_fileobj
+
+        # The SDL release ZIPs are mostly other toolchains and docs. When they
+        # don't need to be kept and the server does byte ranges, pull just the
+        # TOOLCHAIN_NAME members straight into the tmp dir instead.
+        jobs = [
+            ("Downloading SDLite (repo)...", repo_url, repo_zip, None),
+            ("Downloading SDL2...", sdl2_url, sdl_zip, None if keep_downloads else tmp_sdl),
+            ("Downloading SDL2_image...", img_url, img_zip, None if keep_downloads else tmp_img),
+        ]
+        # remote extraction reports through the same label, so it counts as download
+        dl_phases = {
+            jobs[0][0]: phases["repo_dl"],
+            jobs[1][0]: phases["sdl_dl"],
+            jobs[2][0]: phases["img_dl"],
+        }
+
+        # label -> (got, total); written from the download workers
+        dl_state: dict[str, tuple[int, int | None]] = {label: (0, None) for label, _, _, _ in jobs}
+        dl_lock = threading.Lock()
+        dl_abort = threading.Event()
+        dl_marquee = [False]
+
+        def per_file_cb(dp: DownloadProgress):
+            if dl_abort.is_set():
+                raise InstallError("Download cancelled.")
+            if dp.total:
+                dl_phases[dp.label].update(dp.got / dp.total)
+            with dl_lock:
+                dl_state[dp.label] = (dp.got, dp.total)
+                got = sum(g for g, _ in dl_state.values())
+                totals = [t for _, t in dl_state.values()]
+                # the phase table drives the bar as long as any size is known;
+                # spin only while none is
+                spin = not any(totals)
+                changed = spin != dl_marquee[0]
+                dl_marquee[0] = spin
+            if changed:
+                marquee(spin)
+            if all(t for t in totals):
+                percent = int((got * 100) / sum(totals))
+                status(f"Downloading files... ({percent}%)")
+            else:
+                status(f"Downloading files... ({got // 1024} KiB)")
+
+        def fetch_job(url: str, target, label: str, remote_dir: Path | None) -> bool:
+            """True if the archive was extracted into remote_dir while fetching."""
+            if remote_dir is not None:
+                try:
+                    if extract_remote_zip(dl, url, remote_dir, label, per_file_cb, make_select=toolchain_member_filter):
+                        return True
+                except InstallError as e:
+                    if dl_abort.is_set():
+                        raise
+                    # whatever was extracted so far is redone from the full download
+                    log(f"Byte-range extraction failed, downloading the whole archive instead:\n{e}")
+                    delete_tree(remote_dir)
+                    ensure_dir(remote_dir)
+            fetch(url, target, label, per_file_cb)
+            return False
+
+        for _, url, _, _ in jobs:
+            log(f"Downloading: {url}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+            futures = [
+                ex.submit(fetch_job, url, target, label, remote_dir)
+                for label, url, target, remote_dir in jobs
+            ]
+            done, not_done = concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_EXCEPTION
+            )
+            failed = [f for f in done if f.exception() is not None]
+            if failed:
+                # stop the siblings at their next chunk instead of finishing their transfers
+                dl_abort.set()
+                for f in not_done:
+                    f.cancel()
+                raise failed[0].exception()
+        _, sdl_remote, img_remote = (f.result() for f in futures)
+
+        marquee(False)
+        for phase in dl_phases.values():
+            phase.update(1.0)
+
+        for spool in spools:
+            spool.seek(0)
+
+        # extract repo
+        status("Extracting SDLite repo...")
+        reserved = {".downloads", ".tmp_repo", ".tmp_sdl2", ".tmp_sdl2_image"}
+        prefix = find_zip_project_root(repo_zip, repo_markers)
+        if prefix is not None:
+            # root known from the listing: write members straight to their
+            # final place, minus the wrapper folder
+            log(f"Repo root in ZIP: /{prefix}")
+            log(f"Extracting repo ZIP -> {install_dir}")
+            extract_zip_parallel(
+                repo_zip,
+                install_dir,
+                select=lambda name: name[len(prefix):].split("/", 1)[0] not in reserved,
+                strip=prefix,
+            )
+            phases["extract"].update(1 / 3)
+            status("Applying project layout...")
+        else:
+            log(f"Extracting repo ZIP -> {tmp_repo}")
+            extract_zip_parallel(repo_zip, tmp_repo)
+
+            repo_root = find_project_root_near(tmp_repo, repo_markers)
+            log(f"Repo root selected: {repo_root}")
+            phases["extract"].update(1 / 3)
+
+            status("Applying project layout...")
+
+            with os.scandir(repo_root) as it:
+                entries = list(it)
+            for entry in entries:
+                if entry.name in reserved:
+                    continue
+                move_tree(Path(entry.path), install_dir / entry.name)
+
+        log("Repo files copied into install directory.")
+        ensure_structure(install_dir, structure)
+        phases["layout"].update(0.3)
+
+        # ---------------- SDL2 FIRST ----------------
+        status("Extracting SDL2...")
+        if sdl_remote:
+            log(f"SDL2 was extracted during download (byte ranges) -> {tmp_sdl}")
+        else:
+            log(f"Extracting SDL2 ZIP -> {tmp_sdl}")
+            extract_zip_parallel(sdl_zip, tmp_sdl)
+        phases["extract"].update(2 / 3)
+
+        status("Installing SDL2 (staging)...")
+        stage_install_sdl_zip(
+            tmp_extract_dir=tmp_sdl,
+            install_dir=install_dir,
+            external_name="SDL2",
+            log=log,
+            prefer_copy=cfg["prefer_copy"],
+        )
+        phases["layout"].update(0.6)
+
+        # ---------------- SDL2_image SECOND ----------------
+        status("Extracting SDL2_image...")
+        if img_remote:
+            log(f"SDL2_image was extracted during download (byte ranges) -> {tmp_img}")
+        else:
+            log(f"Extracting SDL2_image ZIP -> {tmp_img}")
+            extract_zip_parallel(img_zip, tmp_img)
+        phases["extract"].update(1.0)
+
+        status("Installing SDL2_image (staging)...")
+        stage_install_sdl_zip(
+            tmp_extract_dir=tmp_img,
+            install_dir=install_dir,
+            external_name="SDL2_image",
+            log=log,
+            prefer_copy=cfg["prefer_copy"],
+        )
+        phases["layout"].update(0.9)
+
+        ensure_structure(install_dir, structure)
+
+        # cleanup
+        status("Cleaning up...")
+
+        if not cfg["keep_temp"]:
+            delete_tree(tmp_repo)
+            delete_tree(tmp_sdl)
+            delete_tree(tmp_img)
+        else:
+            log("Keeping temp folders (.tmp_*) for debugging (Options enabled).")
+
+        if not keep_downloads:
+            delete_tree(dl_dir)
+        else:
+            log("Keeping downloads (.downloads) (Options enabled).")
+
+        # validate
+        status("Validating install...")
+        phases["layout"].update(1.0)
+
+        markers = structure.get("markers", {})
+        for k, rel in markers.items():
+            p = install_dir / Path(rel)
+            log(("OK: " if p.is_file() else "WARNING: ") + f"{k} marker -> {rel}")
+
+        # also log the toolchain folder presence (what you care about)
+        for dep in ("SDL2", "SDL2_image"):
+            tc = install_dir / "external" / dep / TOOLCHAIN_NAME
+            log(("OK: " if tc.is_dir() else "WARNING: ") + f"{dep} toolchain folder -> {tc}")
+
+        q.put(("done", f"Install path:\n{install_dir}"))
+
+    except Exception as e:
+        q.put(("fail", str(e)))
+    finally:
+        for spool in spools:
+            spool.close()
+        dl.close()
+
 
 # ========================= UI =========================
 
@@ -531,7 +1696,15 @@ class App(tk.Tk):
         self.minsize(780, 500)
 
         self.installing = False
-        self.msg_q: queue.Queue[tuple[str, object]] = queue.Queue()
+        self.worker: multiprocessing.Process | None = None
+        self.msg_q: multiprocessing.Queue | None = None
+
+        # Progress is high-frequency and only the latest value matters, so
+        # _pump_msgs folds every "progress" message of a tick into this and
+        # applies it to the widgets once.
+        self.progress_state = {"pct": 0, "status": "", "marquee": False}
+        self.progress_dirty = False
+        self.marquee_on = False
 
         # options vars
         self.var_install_subfolder = tk.StringVar(value=DEFAULT_INSTALL_SUBFOLDER)
@@ -626,8 +1799,14 @@ class App(tk.Tk):
         OptionsDialog(self)
 
     def ui_log(self, text: str) -> None:
+        self.ui_log_lines([text])
+
+    def ui_log_lines(self, lines: list[str]) -> None:
+        """Append several lines with a single insert/see (one relayout)."""
+        if not lines:
+            return
         self.log.configure(state="normal")
-        self.log.insert("end", text + "\n")
+        self.log.insert("end", "\n".join(lines) + "\n")
         self.log.see("end")
         self.log.configure(state="disabled")
 
@@ -639,6 +1818,7 @@ class App(tk.Tk):
         self.pb["value"] = max(0, min(100, pct))
 
     def ui_progress_marquee(self, on: bool) -> None:
+        self.marquee_on = on
         if on:
             self.pb.configure(mode="indeterminate")
             self.pb.start(12)
@@ -646,24 +1826,47 @@ class App(tk.Tk):
             self.pb.stop()
             self.pb.configure(mode="determinate")
 
+    def _apply_progress(self) -> None:
+        if not self.progress_dirty:
+            return
+        self.progress_dirty = False
+        state = self.progress_state
+        if state["status"]:
+            self.ui_status(state["status"])
+        if state["marquee"] != self.marquee_on:
+            self.ui_progress_marquee(state["marquee"])
+        if not state["marquee"]:
+            self.ui_progress_determinate(state["pct"])
+
     def _pump_msgs(self):
-        try:
-            while True:
-                kind, payload = self.msg_q.get_nowait()
-                if kind == "log":
-                    self.ui_log(str(payload))
-                elif kind == "status":
-                    self.ui_status(str(payload))
-                elif kind == "pct":
-                    self.ui_progress_determinate(int(payload))
-                elif kind == "marquee":
-                    self.ui_progress_marquee(bool(payload))
-                elif kind == "done":
-                    self._finish_install(success=True, details=str(payload))
-                elif kind == "fail":
-                    self._finish_install(success=False, details=str(payload))
-        except queue.Empty:
-            pass
+        # sample liveness before draining, so a worker that posted its result
+        # and exited in between isn't mistaken for a crash
+        worker_alive = self.worker is not None and self.worker.is_alive()
+        lines: list[str] = []
+        if self.msg_q is not None:
+            try:
+                while True:
+                    kind, payload = self.msg_q.get_nowait()
+                    if kind == "progress":
+                        self.progress_state.update(payload)
+                        self.progress_dirty = True
+                    elif kind == "log":
+                        lines.append(str(payload))
+                    elif kind in ("done", "fail"):
+                        self.ui_log_lines(lines)
+                        lines = []
+                        self._apply_progress()
+                        self._finish_install(success=(kind == "done"), details=str(payload))
+            except queue.Empty:
+                pass
+        self.ui_log_lines(lines)
+        self._apply_progress()
+
+        if self.installing and self.worker is not None and not worker_alive:
+            self._finish_install(
+                success=False,
+                details=f"Installer worker exited unexpectedly (exit code {self.worker.exitcode}).",
+            )
         self.after(50, self._pump_msgs)
 
     def on_exit(self):
@@ -684,16 +1887,33 @@ class App(tk.Tk):
         sub = self.var_install_subfolder.get().strip() or DEFAULT_INSTALL_SUBFOLDER
         install_dir = Path(chosen) / sub
 
+        # snapshot the options here; the worker process can't touch Tk variables
+        cfg = {
+            "install_dir": str(install_dir),
+            "structure_mode": self.var_structure_mode.get(),
+            "custom_structure": self.var_custom_structure.get(),
+            "repo_url": self.var_repo_url.get(),
+            "sdl2_url": self.var_sdl2_url.get(),
+            "img_url": self.var_img_url.get(),
+            "keep_downloads": self.var_keep_downloads.get(),
+            "keep_temp": self.var_keep_temp.get(),
+            "prefer_copy": self.var_prefer_copy.get(),
+        }
+
         self.installing = True
+        self.progress_state.update(pct=0, status="", marquee=False)
+        self.progress_dirty = False
         self.btn_install.configure(state="disabled")
         self.btn_options.configure(state="disabled")
         self.btn_exit.configure(state="disabled")
 
-        t = threading.Thread(target=self._install_thread, args=(install_dir,), daemon=True)
-        t.start()
+        self.msg_q = multiprocessing.Queue()
+        self.worker = multiprocessing.Process(target=_install_worker, args=(cfg, self.msg_q), daemon=True)
+        self.worker.start()
 
     def _finish_install(self, success: bool, details: str):
         self.installing = False
+        self.worker = None
         self.btn_install.configure(state="normal")
         self.btn_options.configure(state="normal")
         self.btn_exit.configure(state="normal")
@@ -707,172 +1927,6 @@ class App(tk.Tk):
             messagebox.showerror("SDLite Setup", details)
             self.ui_status("Failed.")
 
-    def _post(self, kind: str, payload):
-        self.msg_q.put((kind, payload))
-
-    def _install_thread(self, install_dir: Path):
-        def log(s: str): self._post("log", s)
-        def status(s: str): self._post("status", s)
-        def pct(n: int): self._post("pct", n)
-        def marquee(on: bool): self._post("marquee", on)
-
-        try:
-            # structure selection
-            if self.var_structure_mode.get() == "custom":
-                structure = parse_structure_json(self.var_custom_structure.get())
-            else:
-                structure = DEFAULT_STRUCTURE
-
-            repo_markers = structure.get("repo_root_markers", DEFAULT_ROOT_MARKERS)
-
-            repo_url = self.var_repo_url.get().strip()
-            sdl2_url = self.var_sdl2_url.get().strip()
-            img_url = self.var_img_url.get().strip()
-
-            if not repo_url or not sdl2_url or not img_url:
-                raise InstallError("Missing one or more download URLs (check Options...).")
-
-            status("Preparing...")
-            log(f"Install directory: {install_dir}")
-            ensure_dir(install_dir)
-
-            # temp dirs
-            dl_dir = install_dir / ".downloads"
-            tmp_repo = install_dir / ".tmp_repo"
-            tmp_sdl = install_dir / ".tmp_sdl2"
-            tmp_img = install_dir / ".tmp_sdl2_image"
-
-            for d in (dl_dir, tmp_repo, tmp_sdl, tmp_img):
-                delete_tree(d)
-                ensure_dir(d)
-
-            repo_zip = dl_dir / "repo.zip"
-            sdl_zip = dl_dir / "sdl2.zip"
-            img_zip = dl_dir / "sdl2_image.zip"
-
-            status("Downloading files...")
-            pct(0)
-
-            dl = Downloader()
-
-            def progress_cb(dp: DownloadProgress):
-                if dp.total and dp.total > 0:
-                    marquee(False)
-                    percent = int((dp.got * 100) / dp.total)
-                    status(f"{dp.label} ({percent}%)")
-                    pct(percent)
-                else:
-                    marquee(True)
-                    status(f"{dp.label} (downloading...)")
-
-            log(f"Downloading: {repo_url}")
-            dl.download(repo_url, repo_zip, "Downloading SDLite (repo)...", progress_cb)
-            marquee(False)
-            pct(10)
-
-            log(f"Downloading: {sdl2_url}")
-            dl.download(sdl2_url, sdl_zip, "Downloading SDL2...", progress_cb)
-            marquee(False)
-            pct(20)
-
-            log(f"Downloading: {img_url}")
-            dl.download(img_url, img_zip, "Downloading SDL2_image...", progress_cb)
-            marquee(False)
-            pct(30)
-
-            # extract repo
-            status("Extracting SDLite repo...")
-            pct(35)
-            log(f"Extracting repo ZIP -> {tmp_repo}")
-            extract_zip(repo_zip, tmp_repo)
-
-            repo_root = find_project_root_near(tmp_repo, repo_markers)
-            log(f"Repo root selected: {repo_root}")
-            pct(42)
-
-            status("Applying project layout...")
-            pct(45)
-
-            for item in repo_root.iterdir():
-                if item.name in {".downloads", ".tmp_repo", ".tmp_sdl2", ".tmp_sdl2_image"}:
-                    continue
-                move_tree(item, install_dir / item.name)
-
-            log("Repo files copied into install directory.")
-            ensure_structure(install_dir, structure)
-            pct(55)
-
-            # ---------------- SDL2 FIRST ----------------
-            status("Extracting SDL2...")
-            pct(60)
-            log(f"Extracting SDL2 ZIP -> {tmp_sdl}")
-            extract_zip(sdl_zip, tmp_sdl)
-
-            status("Installing SDL2 (staging)...")
-            pct(68)
-            stage_install_sdl_zip(
-                tmp_extract_dir=tmp_sdl,
-                install_dir=install_dir,
-                external_name="SDL2",
-                log=log,
-                prefer_copy=self.var_prefer_copy.get(),
-            )
-            pct(78)
-
-            # ---------------- SDL2_image SECOND ----------------
-            status("Extracting SDL2_image...")
-            pct(82)
-            log(f"Extracting SDL2_image ZIP -> {tmp_img}")
-            extract_zip(img_zip, tmp_img)
-
-            status("Installing SDL2_image (staging)...")
-            pct(88)
-            stage_install_sdl_zip(
-                tmp_extract_dir=tmp_img,
-                install_dir=install_dir,
-                external_name="SDL2_image",
-                log=log,
-                prefer_copy=self.var_prefer_copy.get(),
-            )
-            pct(94)
-
-            ensure_structure(install_dir, structure)
-
-            # cleanup
-            status("Cleaning up...")
-            pct(96)
-
-            if not self.var_keep_temp.get():
-                delete_tree(tmp_repo)
-                delete_tree(tmp_sdl)
-                delete_tree(tmp_img)
-            else:
-                log("Keeping temp folders (.tmp_*) for debugging (Options enabled).")
-
-            if not self.var_keep_downloads.get():
-                delete_tree(dl_dir)
-            else:
-                log("Keeping downloads (.downloads) (Options enabled).")
-
-            # validate
-            status("Validating install...")
-            pct(100)
-
-            markers = structure.get("markers", {})
-            for k, rel in markers.items():
-                p = install_dir / Path(rel)
-                log(("OK: " if p.is_file() else "WARNING: ") + f"{k} marker -> {rel}")
-
-            # also log the toolchain folder presence (what you care about)
-            for dep in ("SDL2", "SDL2_image"):
-                tc = install_dir / "external" / dep / TOOLCHAIN_NAME
-                log(("OK: " if tc.is_dir() else "WARNING: ") + f"{dep} toolchain folder -> {tc}")
-
-            self._post("done", f"Install path:\n{install_dir}")
-
-        except Exception as e:
-            self._post("fail", str(e))
-
 
 def main():
     app = App()
@@ -880,4 +1934,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()